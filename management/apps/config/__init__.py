@@ -13,7 +13,8 @@ from pathlib import Path
 ROOT_DIR = Path(__file__).resolve().parent.parent.parent
 
 # Add the root directory to the Python path
-sys.path.append(str(ROOT_DIR))
+if os.fspath(ROOT_DIR) not in sys.path:
+    sys.path.append(os.fspath(ROOT_DIR))
 
 # Create logs directory
 LOGS_DIR = ROOT_DIR / "logs"
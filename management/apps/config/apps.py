@@ -0,0 +1,19 @@
+from django.apps import AppConfig
+
+
+class ConfigConfig(AppConfig):
+    name = "apps.config"
+
+    def ready(self):
+        from django.contrib import admin
+
+        from apps.config import checks  # noqa: F401 (registers the system checks)
+        from apps.config.log_queue import start_listener
+
+        # Write queued log records to the log files in a background thread
+        start_listener()
+
+        # Admin site customization, set once here rather than in every URLconf
+        admin.site.site_header = "Management Portal"
+        admin.site.site_title = "Management Admin"
+        admin.site.index_title = "Administration"
@@ -0,0 +1,86 @@
+"""
+System checks for the split middleware stack and the deployment settings.
+
+Django's admin, security and debug toolbar checks only look in MIDDLEWARE, so
+they are silenced in settings. These checks take their place and look in
+WEB_ONLY_MIDDLEWARE as well, so a middleware that is really missing is still
+reported.
+"""
+
+from django.conf import settings
+from django.core.checks import Error, Tags, Warning, register
+
+# Middleware the admin needs, with the built-in check each one replaces
+ADMIN_MIDDLEWARE = (
+    ("django.contrib.auth.middleware.AuthenticationMiddleware", "admin.E408"),
+    ("django.contrib.messages.middleware.MessageMiddleware", "admin.E409"),
+    ("django.contrib.sessions.middleware.SessionMiddleware", "admin.E410"),
+)
+
+# Middleware the deployment checks expect, with the built-in check each one replaces
+SECURITY_MIDDLEWARE = (
+    ("django.middleware.clickjacking.XFrameOptionsMiddleware", "security.W002"),
+    ("django.middleware.csrf.CsrfViewMiddleware", "security.W003"),
+)
+
+DEBUG_TOOLBAR_MIDDLEWARE = "debug_toolbar.middleware.DebugToolbarMiddleware"
+
+
+def _installed_middleware():
+    return set(settings.MIDDLEWARE) | set(getattr(settings, "WEB_ONLY_MIDDLEWARE", ()))
+
+
+@register(Tags.admin)
+def check_admin_middleware(app_configs, **kwargs):
+    """Check that the admin's middleware is installed somewhere in the stack"""
+    if "django.contrib.admin" not in settings.INSTALLED_APPS:
+        return []
+
+    installed = _installed_middleware()
+    errors = [
+        Error(
+            f"'{path}' must be in MIDDLEWARE or WEB_ONLY_MIDDLEWARE in order to use the admin "
+            f"application (replaces {check_id}).",
+            id=f"config.E{index:03d}",
+        )
+        for index, (path, check_id) in enumerate(ADMIN_MIDDLEWARE, start=1)
+        if path not in installed
+    ]
+
+    if "debug_toolbar" in settings.INSTALLED_APPS and DEBUG_TOOLBAR_MIDDLEWARE not in installed:
+        errors.append(
+            Warning(
+                f"'{DEBUG_TOOLBAR_MIDDLEWARE}' is missing from MIDDLEWARE and "
+                "WEB_ONLY_MIDDLEWARE (replaces debug_toolbar.W001).",
+                id="config.W001",
+            )
+        )
+    return errors
+
+
+@register(Tags.security, deploy=True)
+def check_security_middleware(app_configs, **kwargs):
+    """Check that the clickjacking and CSRF middleware are installed"""
+    installed = _installed_middleware()
+    return [
+        Warning(
+            f"'{path}' is not in MIDDLEWARE or WEB_ONLY_MIDDLEWARE (replaces {check_id}).",
+            id=f"config.W{index:03d}",
+        )
+        for index, (path, check_id) in enumerate(SECURITY_MIDDLEWARE, start=2)
+        if path not in installed
+    ]
+
+
+@register(Tags.security)
+def check_allowed_hosts(app_configs, **kwargs):
+    """Check that ALLOWED_HOSTS is set whenever DEBUG is off"""
+    if settings.DEBUG or any(settings.ALLOWED_HOSTS):
+        return []
+    return [
+        Error(
+            "ALLOWED_HOSTS is empty while DEBUG is off.",
+            hint="Set the DJANGO_ALLOWED_HOSTS environment variable.",
+            id="config.E004",
+        )
+    ]
@@ -0,0 +1,63 @@
+"""
+Background logging queue.
+
+Loggers hand their records to a QueueHandler that puts them on ``queue``;
+a QueueListener thread then writes them to the file handlers, keeping
+disk I/O off request threads.
+"""
+
+import atexit
+import logging
+import os
+import queue as queue_module
+from logging.handlers import QueueListener
+
+# Queue shared by the "queue" handler in LOGGING and the listener
+queue = queue_module.Queue(-1)
+
+# Logger whose handlers (configured in LOGGING) receive the queued records
+SINK_LOGGER = "apps.config.log_queue"
+
+_listener = None
+_hooks_registered = False
+
+
+def start_listener():
+    """Start the background listener thread, if it isn't running already."""
+    global _listener, _hooks_registered
+    if _listener is not None:
+        return
+
+    handlers = logging.getLogger(SINK_LOGGER).handlers
+    _listener = QueueListener(queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
+    if not _hooks_registered:
+        _hooks_registered = True
+        atexit.register(stop_listener)
+        # Forked workers (Celery prefork, gunicorn --preload) inherit the queue
+        # but not the listener thread
+        os.register_at_fork(after_in_child=_restart_listener_in_child)
+
+
+def _restart_listener_in_child():
+    """Give a forked child its own listener thread."""
+    global _listener
+    if _listener is None:
+        return
+
+    # The parent's listener may have held the queue's lock at fork time, and
+    # any records still queued are written by the parent, so start empty
+    queue.__init__(-1)
+    _listener = None
+    start_listener()
+
+
+def stop_listener():
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    if _listener is None:
+        return
+
+    _listener.stop()
+    _listener = None
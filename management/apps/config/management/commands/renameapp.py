@@ -2,13 +2,162 @@
 Custom management command to rename a Django app with all necessary changes.
 """
 
+import functools
 import os
+import re
 import sys
-import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from django.core.management.base import BaseCommand, CommandError
 from django.conf import settings
-from django.db import connection
+
+# Number of threads used to rewrite app files (the work is I/O-bound)
+REWRITE_WORKERS = 8
+
+# Names used by Django's built-in apps
+RESERVED_APP_NAMES = frozenset(
+    {"admin", "auth", "contenttypes", "sessions", "messages", "staticfiles"}
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _reference_replacements(old_name, new_name):
+    """Return the (old, new) pairs used to rewrite imports inside the app"""
+    return (
+        (f"apps.{old_name}", f"apps.{new_name}"),
+        (f"from {old_name} import", f"from {new_name} import"),
+        (f"from {old_name}.", f"from {new_name}."),
+        (f"app_name = '{old_name}'", f"app_name = '{new_name}'"),
+        (f'app_name = "{old_name}"', f'app_name = "{new_name}"'),
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _url_replacements(old_name, new_name):
+    """Return the (old, new) pairs used to rewrite the URL configuration"""
+    return (
+        (f'path("{old_name}/', f'path("{new_name}/'),
+        (f"path('{old_name}/'", f"path('{new_name}/'"),
+        (f'include("apps.{old_name}', f'include("apps.{new_name}'),
+        (f"include('apps.{old_name}", f"include('apps.{new_name}"),
+        (f'namespace="{old_name}"', f'namespace="{new_name}"'),
+        (f"namespace='{old_name}'", f"namespace='{new_name}'"),
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _url_pattern(old_name, new_name):
+    """Compile the URL replacements into one pattern so the file is scanned once"""
+    mapping = dict(_url_replacements(old_name, new_name))
+    pattern = re.compile(
+        "|".join(re.escape(key) for key in sorted(mapping, key=len, reverse=True))
+    )
+    return pattern, mapping
+
+
+def _iter_py_files(app_dir):
+    """Yield the paths of all Python files under ``app_dir``."""
+    for root, dirs, files in os.walk(app_dir):
+        for file in files:
+            if file.endswith(".py"):
+                yield os.path.join(root, file)
+
+
+def _rewrite_references(file_path, old_name, new_name):
+    """Replace imports and references to the old app name in a single file.
+
+    Returns True if the file was changed.
+    """
+    with open(file_path) as f:
+        content = f.read()
+
+    updated_content = content
+    for old, new in _reference_replacements(old_name, new_name):
+        updated_content = updated_content.replace(old, new)
+
+    if content == updated_content:
+        return False
+
+    with open(file_path, "w") as f:
+        f.write(updated_content)
+    return True
+
+
+def _rewrite_app_files(old_name, new_name, app_dir, log):
+    """Rewrite references to the old app name in every Python file of the app"""
+    rewrite = functools.partial(_rewrite_references, old_name=old_name, new_name=new_name)
+    file_paths = list(_iter_py_files(app_dir))
+    # Files are rewritten in parallel; messages are logged from the calling thread
+    with ThreadPoolExecutor(max_workers=REWRITE_WORKERS) as executor:
+        for file_path, changed in zip(file_paths, executor.map(rewrite, file_paths)):
+            if changed:
+                log("SUCCESS", f"Updated references in {file_path}")
+
+
+class _FileCache:
+    """Buffer file contents so each file is read and written at most once"""
+
+    def __init__(self):
+        self._contents = {}
+        self._dirty = set()
+
+    def read(self, path):
+        if path not in self._contents:
+            self._contents[path] = path.read_text()
+        return self._contents[path]
+
+    def write(self, path, content):
+        self._contents[path] = content
+        self._dirty.add(path)
+
+    def flush(self):
+        """Write all modified files back to disk"""
+        for path in self._dirty:
+            path.write_text(self._contents[path])
+        self._dirty.clear()
+
+
+def _rewrite_urls(old_name, new_name, urls_file, log, files):
+    """Update app URL patterns in the given URL configuration file"""
+    if not urls_file.exists():
+        log("WARNING", f"URL configuration file not found at {urls_file}")
+        return False
+
+    content = files.read(urls_file)
+
+    # Apply all replacements in a single pass
+    pattern, mapping = _url_pattern(old_name, new_name)
+    content = pattern.sub(lambda match: mapping[match.group(0)], content)
+
+    files.write(urls_file, content)
+    log("SUCCESS", f"Updated URL configuration in {urls_file}")
+    return True
+
+
+def _rewrite_settings(old_name, new_name, settings_file, log, files):
+    """Update the app name in INSTALLED_APPS of the given settings file"""
+    if not settings_file.exists():
+        log("WARNING", f"Settings file not found at {settings_file}")
+        return False
+
+    content = files.read(settings_file)
+    old_app_path = f'"apps.{old_name}"'
+    new_app_path = f'"apps.{new_name}"'
+
+    if old_app_path not in content:
+        log("NOTICE", f"App '{old_name}' not explicitly listed in settings")
+        return False
+
+    files.write(settings_file, content.replace(old_app_path, new_app_path))
+    log("SUCCESS", f"Updated app name in settings file: {settings_file}")
+    return True
+
+
+def _print_log(level, message):
+    """Log callback used by the standalone function"""
+    if level == "WARNING":
+        message = f"Warning: {message}"
+    print(message)
 
 
 class Command(BaseCommand):
@@ -21,52 +170,15 @@ class Command(BaseCommand):
             "--force", action="store_true", help="Force rename without confirmation"
         )
 
+    def _log(self, level, message):
+        """Write a message to stdout using the style matching ``level``"""
+        self.stdout.write(getattr(self.style, level)(message))
+
     def _update_urls(self, old_name, new_name):
         """Update app URLs in the main URL configuration"""
         try:
-            # Locate the main URL configuration file
             base_urls_file = settings.ROOT_DIR / "apps" / "config" / "urls" / "base.py"
-
-            if base_urls_file.exists():
-                content = base_urls_file.read_text()
-
-                # Look for URL patterns with either single or double quotes
-                old_pattern_double = f'path("{old_name}/"'
-                old_pattern_single = f"path('{old_name}/'"
-                old_namespace_double = f'namespace="{old_name}"'
-                old_namespace_single = f"namespace='{old_name}'"
-
-                # New patterns for replacement
-                new_pattern_double = f'path("{new_name}/"'
-                new_pattern_single = f"path('{new_name}/'"
-                new_namespace_double = f'namespace="{new_name}"'
-                new_namespace_single = f"namespace='{new_name}'"
-
-                # Prepare replacement mapping
-                replacements = [
-                    (f'path("{old_name}/', f'path("{new_name}/'),
-                    (f"path('{old_name}/'", f"path('{new_name}/'"),
-                    (f'include("apps.{old_name}', f'include("apps.{new_name}'),
-                    (f"include('apps.{old_name}", f"include('apps.{new_name}"),
-                    (f'namespace="{old_name}"', f'namespace="{new_name}"'),
-                    (f"namespace='{old_name}'", f"namespace='{new_name}'"),
-                ]
-
-                # Apply all replacements
-                for old, new in replacements:
-                    content = content.replace(old, new)
-
-                # Write updated content
-                base_urls_file.write_text(content)
-                self.stdout.write(
-                    self.style.SUCCESS(f"Updated URL configuration in {base_urls_file}")
-                )
-                return True
-            else:
-                self.stdout.write(
-                    self.style.WARNING(f"URL configuration file not found at {base_urls_file}")
-                )
-                return False
+            return _rewrite_urls(old_name, new_name, base_urls_file, self._log, self._files)
         except Exception as e:
             self.stdout.write(self.style.ERROR(f"Error updating URL configuration: {e}"))
             return False
@@ -75,33 +187,17 @@ class Command(BaseCommand):
         """Update app name in settings.py"""
         try:
             settings_file = settings.ROOT_DIR / "apps" / "config" / "settings" / "base.py"
-
-            if settings_file.exists():
-                content = settings_file.read_text()
-                old_app_path = f'"apps.{old_name}"'
-                new_app_path = f'"apps.{new_name}"'
-
-                # Replace the app name in INSTALLED_APPS
-                if old_app_path in content:
-                    content = content.replace(old_app_path, new_app_path)
-                    settings_file.write_text(content)
-                    self.stdout.write(
-                        self.style.SUCCESS(f"Updated app name in settings file: {settings_file}")
-                    )
-                    return True
-                else:
-                    self.stdout.write(
-                        self.style.NOTICE(f"App '{old_name}' not explicitly listed in settings")
-                    )
-            else:
-                self.stdout.write(self.style.WARNING(f"Settings file not found at {settings_file}"))
-            return False
+            return _rewrite_settings(
+                old_name, new_name, settings_file, self._log, self._files
+            )
         except Exception as e:
             self.stdout.write(self.style.ERROR(f"Error updating settings: {e}"))
             return False
 
     def _update_migrations(self, old_name, new_name):
         """Update app name in migration records"""
+        from django.db import connection
+
         try:
             with connection.cursor() as cursor:
                 # Update app name in django_migrations table
@@ -120,27 +216,7 @@ class Command(BaseCommand):
     def _update_app_references(self, old_name, new_name, app_dir):
         """Update references within the app files"""
         try:
-            # Walk through all Python files in the app
-            for root, dirs, files in os.walk(app_dir):
-                for file in files:
-                    if file.endswith(".py"):
-                        file_path = Path(root) / file
-                        content = file_path.read_text()
-
-                        # Replace imports and references
-                        updated_content = (
-                            content.replace(f"apps.{old_name}", f"apps.{new_name}")
-                            .replace(f"from {old_name} import", f"from {new_name} import")
-                            .replace(f"from {old_name}.", f"from {new_name}.")
-                            .replace(f"app_name = '{old_name}'", f"app_name = '{new_name}'")
-                            .replace(f'app_name = "{old_name}"', f'app_name = "{new_name}"')
-                        )
-
-                        if content != updated_content:
-                            file_path.write_text(updated_content)
-                            self.stdout.write(
-                                self.style.SUCCESS(f"Updated references in {file_path}")
-                            )
+            _rewrite_app_files(old_name, new_name, app_dir, self._log)
             return True
         except Exception as e:
             self.stdout.write(self.style.ERROR(f"Error updating app references: {e}"))
@@ -175,6 +251,8 @@ class Command(BaseCommand):
 
         # Ask for confirmation
         if not force:
+            if not sys.stdin.isatty():
+                raise CommandError("Refusing to prompt for confirmation: re-run with --force")
             self.stdout.write(
                 self.style.WARNING(f"You are about to rename app '{old_name}' to '{new_name}'")
             )
@@ -183,14 +261,19 @@ class Command(BaseCommand):
                 self.stdout.write(self.style.SUCCESS("App renaming cancelled."))
                 return
 
+        import shutil
+
         # Update references first (before renaming directory)
         self._update_app_references(old_name, new_name, old_app_dir)
 
-        # Update URLs
+        # Update URLs and settings, writing each file once
+        self._files = _FileCache()
         self._update_urls(old_name, new_name)
-
-        # Update settings
         self._update_settings(old_name, new_name)
+        try:
+            self._files.flush()
+        except Exception as e:
+            raise CommandError(f"Error writing configuration files: {e}")
 
         # Update migrations
         self._update_migrations(old_name, new_name)
@@ -241,7 +324,6 @@ def rename_app_standalone(old_name, new_name, force=False, project_root=None):
             return 1
             
         # Check for reserved app names
-        RESERVED_APP_NAMES = ['admin', 'auth', 'contenttypes', 'sessions', 'messages', 'staticfiles']
         if new_name.lower() in RESERVED_APP_NAMES:
             print(f"Error: '{new_name}' is a reserved name used by Django's built-in apps.")
             print("Please choose a different name.")
@@ -264,82 +346,48 @@ def rename_app_standalone(old_name, new_name, force=False, project_root=None):
             
         # Ask for confirmation
         if not force:
+            if not sys.stdin.isatty():
+                print("Error: Refusing to prompt for confirmation: re-run with --force")
+                return 1
             print(f"WARNING: You are about to rename app '{old_name}' to '{new_name}'")
             confirm = input("Are you sure you want to proceed? [y/N]: ")
             if confirm.lower() != "y":
                 print("App renaming cancelled.")
                 return 0
-                
+
+        import shutil
+
         # Update files within the app
         try:
-            # Walk through all Python files in the app
-            for root, dirs, files in os.walk(old_app_dir):
-                for file in files:
-                    if file.endswith(".py"):
-                        file_path = Path(root) / file
-                        content = file_path.read_text()
-                        
-                        # Replace imports and references
-                        updated_content = (
-                            content.replace(f"apps.{old_name}", f"apps.{new_name}")
-                            .replace(f"from {old_name} import", f"from {new_name} import")
-                            .replace(f"from {old_name}.", f"from {new_name}.")
-                            .replace(f"app_name = '{old_name}'", f"app_name = '{new_name}'")
-                            .replace(f'app_name = "{old_name}"', f'app_name = "{new_name}"')
-                        )
-                        
-                        if content != updated_content:
-                            file_path.write_text(updated_content)
-                            print(f"Updated references in {file_path}")
+            _rewrite_app_files(old_name, new_name, old_app_dir, _print_log)
         except Exception as e:
             print(f"Error updating app references: {e}")
             return 1
-            
+
+        files = _FileCache()
+
         # Update URLs
         try:
             base_urls_file = apps_dir / "config" / "urls" / "base.py"
-            if base_urls_file.exists():
-                content = base_urls_file.read_text()
-                
-                # Prepare replacement mapping
-                replacements = [
-                    (f'path("{old_name}/', f'path("{new_name}/'),
-                    (f"path('{old_name}/'", f"path('{new_name}/'"),
-                    (f'include("apps.{old_name}', f'include("apps.{new_name}'),
-                    (f"include('apps.{old_name}", f"include('apps.{new_name}"),
-                    (f'namespace="{old_name}"', f'namespace="{new_name}"'),
-                    (f"namespace='{old_name}'", f"namespace='{new_name}'"),
-                ]
-                
-                # Apply all replacements
-                for old, new in replacements:
-                    content = content.replace(old, new)
-                    
-                # Write updated content
-                base_urls_file.write_text(content)
-                print(f"Updated URL configuration in {base_urls_file}")
+            _rewrite_urls(old_name, new_name, base_urls_file, _print_log, files)
         except Exception as e:
             print(f"Warning: Could not update URL configuration: {e}")
             print("Continuing with app renaming anyway...")
-            
+
         # Update settings
         try:
             settings_file = apps_dir / "config" / "settings" / "base.py"
-            if settings_file.exists():
-                content = settings_file.read_text()
-                old_app_path = f'"apps.{old_name}"'
-                new_app_path = f'"apps.{new_name}"'
-                
-                # Replace the app name in INSTALLED_APPS
-                if old_app_path in content:
-                    content = content.replace(old_app_path, new_app_path)
-                    settings_file.write_text(content)
-                    print(f"Updated app name in settings file: {settings_file}")
-                else:
-                    print(f"App '{old_name}' not explicitly listed in settings")
+            _rewrite_settings(old_name, new_name, settings_file, _print_log, files)
         except Exception as e:
             print(f"Warning: Could not update settings: {e}")
-            
+
+        # Write the updated configuration files
+        try:
+            files.flush()
+        except Exception as e:
+            print(f"Error writing configuration files: {e}")
+            return 1
+
         # Update migrations in database
         try:
             # This would normally use Django's connection, 
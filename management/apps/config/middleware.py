@@ -3,11 +3,91 @@ Custom middleware for the application.
 """
 
 import os
+import sys
 import logging
 
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.core.handlers.exception import convert_exception_to_response
+from django.utils.module_loading import import_string
+
 logger = logging.getLogger(__name__)
 
 
+class WebOnlyMiddleware:
+    """
+    Middleware that runs the WEB_ONLY_MIDDLEWARE chain for non-API requests.
+
+    Requests under API_URL_PREFIX are JWT-authenticated JSON calls that never
+    use sessions, CSRF, messages or the debug tooling, so they bypass that
+    part of the stack; API_SESSION_URL_PREFIXES are the exception. The wrapped
+    middleware's process_view, process_template_response and process_exception
+    hooks are registered the same way Django's handler does it, so they keep
+    working for web requests.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.api_prefix = settings.API_URL_PREFIX
+        self.session_prefixes = tuple(getattr(settings, "API_SESSION_URL_PREFIXES", ()))
+        self._view_middleware = []
+        self._template_response_middleware = []
+        self._exception_middleware = []
+
+        handler = get_response
+        for middleware_path in reversed(settings.WEB_ONLY_MIDDLEWARE):
+            middleware_class = import_string(middleware_path)
+            try:
+                middleware = middleware_class(handler)
+            except MiddlewareNotUsed:
+                continue
+
+            if hasattr(middleware, "process_view"):
+                self._view_middleware.insert(0, middleware.process_view)
+            if hasattr(middleware, "process_template_response"):
+                self._template_response_middleware.append(middleware.process_template_response)
+            if hasattr(middleware, "process_exception"):
+                self._exception_middleware.append(middleware.process_exception)
+
+            handler = convert_exception_to_response(middleware)
+
+        self.web_handler = handler
+
+    def _is_api_request(self, request):
+        path = request.path_info
+        return path.startswith(self.api_prefix) and not path.startswith(self.session_prefixes)
+
+    def __call__(self, request):
+        if self._is_api_request(request):
+            return self.get_response(request)
+        return self.web_handler(request)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if self._is_api_request(request):
+            return None
+        for process_view in self._view_middleware:
+            response = process_view(request, view_func, view_args, view_kwargs)
+            if response is not None:
+                return response
+        return None
+
+    def process_template_response(self, request, response):
+        if self._is_api_request(request):
+            return response
+        for process_template_response in self._template_response_middleware:
+            response = process_template_response(request, response)
+        return response
+
+    def process_exception(self, request, exception):
+        if self._is_api_request(request):
+            return None
+        for process_exception in self._exception_middleware:
+            response = process_exception(request, exception)
+            if response is not None:
+                return response
+        return None
+
+
 class EnvironmentCredentialsMiddleware:
     """
     Middleware to display environment credentials at startup.
@@ -27,37 +107,43 @@ class EnvironmentCredentialsMiddleware:
 
     def _show_credentials(self):
         """Print out environment credentials."""
-        print("\n==================== ENVIRONMENT CREDENTIALS ====================")
-
-        # Database settings
-        print("DATABASE SETTINGS:")
-        print(f"POSTGRES_DB: {os.environ.get('POSTGRES_DB', 'Not set')}")
-        print(f"POSTGRES_USER: {os.environ.get('POSTGRES_USER', 'Not set')}")
-        print(
-            f"POSTGRES_PASSWORD: {'*' * len(os.environ.get('POSTGRES_PASSWORD', '')) if os.environ.get('POSTGRES_PASSWORD') else 'Not set'}"
-        )
-        print(f"POSTGRES_HOST: {os.environ.get('POSTGRES_HOST', 'Not set')}")
-        print(f"POSTGRES_PORT: {os.environ.get('POSTGRES_PORT', 'Not set')}")
-
-        # Django settings
-        print("\nDJANGO SETTINGS:")
-        print(f"DJANGO_ENVIRONMENT: {os.environ.get('DJANGO_ENVIRONMENT', 'Not set')}")
-        print(f"DJANGO_DEBUG: {os.environ.get('DJANGO_DEBUG', 'Not set')}")
-        print(
-            f"DJANGO_SECRET_KEY: {'*' * len(os.environ.get('DJANGO_SECRET_KEY', '')) if os.environ.get('DJANGO_SECRET_KEY') else 'Not set'}"
-        )
-        print(f"DJANGO_ALLOWED_HOSTS: {os.environ.get('DJANGO_ALLOWED_HOSTS', 'Not set')}")
-
-        # Celery settings
-        print("\nCELERY SETTINGS:")
-        print(f"CELERY_BROKER_URL: {os.environ.get('CELERY_BROKER_URL', 'Not set')}")
-
-        # Redis settings
-        print("\nREDIS SETTINGS:")
-        print(f"REDIS_URL: {os.environ.get('REDIS_URL', 'Not set')}")
-
-        print("==============================================================\n")
+        env = os.environ
+        lines = [
+            "==================== ENVIRONMENT CREDENTIALS ====================",
+            # Database settings
+            "DATABASE SETTINGS:",
+            f"POSTGRES_DB: {env.get('POSTGRES_DB', 'Not set')}",
+            f"POSTGRES_USER: {env.get('POSTGRES_USER', 'Not set')}",
+            f"POSTGRES_PASSWORD: {self._mask(env.get('POSTGRES_PASSWORD'))}",
+            f"POSTGRES_HOST: {env.get('POSTGRES_HOST', 'Not set')}",
+            f"POSTGRES_PORT: {env.get('POSTGRES_PORT', 'Not set')}",
+            # Django settings
+            "",
+            "DJANGO SETTINGS:",
+            f"DJANGO_ENVIRONMENT: {env.get('DJANGO_ENVIRONMENT', 'Not set')}",
+            f"DJANGO_DEBUG: {env.get('DJANGO_DEBUG', 'Not set')}",
+            f"DJANGO_SECRET_KEY: {self._mask(env.get('DJANGO_SECRET_KEY'))}",
+            f"DJANGO_ALLOWED_HOSTS: {env.get('DJANGO_ALLOWED_HOSTS', 'Not set')}",
+            # Celery settings
+            "",
+            "CELERY SETTINGS:",
+            f"CELERY_BROKER_URL: {env.get('CELERY_BROKER_URL', 'Not set')}",
+            # Redis settings
+            "",
+            "REDIS SETTINGS:",
+            f"REDIS_URL: {env.get('REDIS_URL', 'Not set')}",
+            "==============================================================",
+        ]
+        text = "\n".join(lines)
+
+        # Write the whole block at once so concurrent workers don't interleave
+        sys.stdout.write(f"\n{text}\n\n")
+        sys.stdout.flush()
 
         # Also log to the logger for file logging
-        logger.info("==================== ENVIRONMENT CREDENTIALS ====================")
-        # Add all logger.info statements here...
+        logger.info(text)
+
+    @staticmethod
+    def _mask(value):
+        """Mask a secret value, keeping only its length visible."""
+        return "*" * len(value) if value else "Not set"
@@ -0,0 +1,18 @@
+"""
+Custom pagination classes for the API.
+"""
+
+from rest_framework import pagination
+
+
+class CursorPagination(pagination.CursorPagination):
+    """
+    Keyset pagination used by default for all API list endpoints.
+
+    Pages are fetched with an indexed ``WHERE ... ORDER BY ... LIMIT`` query,
+    so deep pages cost the same as the first one. Ordering by primary key
+    works for every model; views can override ``ordering`` on a subclass to
+    use another indexed, unique column (e.g. ``"-created_at"``).
+    """
+
+    ordering = "-pk"
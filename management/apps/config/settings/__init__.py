@@ -9,22 +9,29 @@ import os
 import sys
 from pathlib import Path
 
-# Try to load environment variables from .env file
-try:
-    from dotenv import load_dotenv
 
-    # Load environment-specific .env file
-    env_file = f".env.{os.environ.get('DJANGO_ENVIRONMENT', 'development')}"
+def _load_env_file(env_file):
+    """Load variables from an .env file, importing dotenv only when needed."""
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        return
+
     load_dotenv(env_file)
     print(f"Loaded environment from {env_file}")
-except ImportError:
-    pass
+
+
+# Load environment-specific .env file if one exists
+env_file = f".env.{os.environ.get('DJANGO_ENVIRONMENT', 'development')}"
+if os.path.isfile(env_file):
+    _load_env_file(env_file)
 
 # Make the root path available - adjusted for new structure
 ROOT_DIR = Path(__file__).resolve().parent.parent.parent.parent
 
 # Add the root directory to the Python path
-sys.path.append(str(ROOT_DIR))
+if os.fspath(ROOT_DIR) not in sys.path:
+    sys.path.append(os.fspath(ROOT_DIR))
 
 # Create logs directory
 LOGS_DIR = ROOT_DIR / "logs"
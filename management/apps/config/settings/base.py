@@ -111,34 +111,34 @@ THIRD_PARTY_APPS = [
 
 # Auto-discover all apps in the project
 try:
-    from apps.config.utils.app_discovery import discover_apps, discover_all_apps
-
-    # Get apps from the standard apps directory (including nested ones)
-    LOCAL_APPS = discover_apps(APPS_DIR, include_subdirs=True)
-
-    # Discover apps in custom directories
-    CUSTOM_APPS = []
+    from apps.config.utils.app_discovery import discover_apps, load_discovered_apps
 
     try:
-        # Get all apps throughout the project
-        all_apps = discover_all_apps(ROOT_DIR)
-
-        # Filter out the ones already in the standard apps directory
-        CUSTOM_APPS = [app for app in all_apps if app not in LOCAL_APPS]
+        # Get apps from the standard apps directory (including nested ones) and
+        # from custom directories, using the on-disk cache when it is fresh
+        LOCAL_APPS, CUSTOM_APPS = load_discovered_apps(APPS_DIR, ROOT_DIR)
     except Exception as e:
         print(f"Warning: Error discovering custom apps: {e}")
+        LOCAL_APPS = discover_apps(APPS_DIR, include_subdirs=True)
+        CUSTOM_APPS = []
 
 except ImportError:
     # Fallback if app_discovery module is not available
     LOCAL_APPS = []
     CUSTOM_APPS = []
 
-# Combine all the app lists
-INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS + CUSTOM_APPS + ["apps.config"]
+# Combine all the app lists (a tuple, so the final setting can't be mutated by accident)
+INSTALLED_APPS = (
+    tuple(DJANGO_APPS)
+    + tuple(THIRD_PARTY_APPS)
+    + tuple(LOCAL_APPS)
+    + tuple(CUSTOM_APPS)
+    + ("apps.config",)
+)
 
 # MIDDLEWARE CONFIGURATION
 # ------------------------------------------------------------------------------
-MIDDLEWARE = [
+MIDDLEWARE = (
     # Security middleware
     "django.middleware.security.SecurityMiddleware",
     # Environment credentials middleware - place it higher in the list
@@ -146,8 +146,21 @@ MIDDLEWARE = [
     # CORS middleware - must be before CommonMiddleware
     "corsheaders.middleware.CorsMiddleware",
     # Django standard middleware
-    "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
+    # Runs WEB_ONLY_MIDDLEWARE for everything outside API_URL_PREFIX
+    "apps.config.middleware.WebOnlyMiddleware",
+)
+
+# JWT-authenticated JSON API; requests under this prefix skip WEB_ONLY_MIDDLEWARE
+API_URL_PREFIX = "/api/"
+
+# Paths under API_URL_PREFIX that still need WEB_ONLY_MIDDLEWARE: the browsable
+# API login/logout views (rest_framework.urls) use the session and CSRF
+API_SESSION_URL_PREFIXES = ("/api/auth/",)
+
+# Middleware only needed by the admin and HTML views
+WEB_ONLY_MIDDLEWARE = (
+    "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
@@ -155,6 +168,20 @@ MIDDLEWARE = [
     # Add Debug Toolbar middleware
     "debug_toolbar.middleware.DebugToolbarMiddleware",
     "django_browser_reload.middleware.BrowserReloadMiddleware",
+)
+
+# The admin, security and debug toolbar checks look for their middleware in
+# MIDDLEWARE only; it is installed through WEB_ONLY_MIDDLEWARE instead. Only
+# these six checks are silenced, and apps/config/checks.py re-runs each of them
+# against MIDDLEWARE + WEB_ONLY_MIDDLEWARE, so a middleware that is really
+# missing is still reported.
+SILENCED_SYSTEM_CHECKS = [
+    "admin.E408",
+    "admin.E409",
+    "admin.E410",
+    "security.W002",
+    "security.W003",
+    "debug_toolbar.W001",
 ]
 
 # URL CONFIGURATION
@@ -180,34 +207,3 @@ REDOC_SETTINGS = {
     "REQUIRED_PROPS_FIRST": True,
     "NO_AUTO_AUTH": True,
 }
-
-# DRF Spectacular Settings
-SPECTACULAR_SETTINGS = {
-    "TITLE": "Management API",
-    "DESCRIPTION": "API documentation for Management System",
-    "VERSION": "1.0.0",
-    "SERVE_INCLUDE_SCHEMA": False,
-    "SWAGGER_UI_SETTINGS": {
-        "deepLinking": True,
-        "persistAuthorization": True,
-        "displayOperationId": True,
-        "filter": True,
-    },
-    "COMPONENT_SPLIT_REQUEST": True,
-    "COMPONENT_SPLIT_RESPONSE": True,
-    "SORT_OPERATIONS": True,
-    "TAGS_SORTER": "alpha",
-    "OPERATIONS_SORTER": "alpha",
-    "DOC_EXPANSION": "none",
-    "DEFAULT_MODEL_RENDERING": "example",
-}
-
-REST_FRAMEWORK = {
-    "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
-    "DEFAULT_AUTHENTICATION_CLASSES": [
-        "apps.authentication.backends.CustomJWTAuthentication",
-    ],
-    "DEFAULT_PERMISSION_CLASSES": [
-        "rest_framework.permissions.IsAuthenticated",
-    ],
-}
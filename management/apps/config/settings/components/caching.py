@@ -6,27 +6,45 @@ in-memory caching options.
 """
 
 import os
+
+import xxhash
+
 from apps.config.settings import ENVIRONMENT
 
 # CACHE CONFIGURATION
 # ------------------------------------------------------------------------------
+# Replies are parsed by hiredis (C), which redis-py picks up automatically
+# when it is installed.
+_REDIS_OPTIONS = {
+    "CLIENT_CLASS": "django_redis.client.DefaultClient",
+    "SOCKET_CONNECT_TIMEOUT": 5,  # seconds
+    "SOCKET_TIMEOUT": 5,  # seconds
+    "IGNORE_EXCEPTIONS": True,  # Don't crash on Redis errors
+    # Reuse connections from a per-process pool
+    "CONNECTION_POOL_KWARGS": {
+        "max_connections": int(os.environ.get("REDIS_MAX_CONNECTIONS", "50")),
+        "retry_on_timeout": True,
+    },
+}
+
 CACHES = {
+    # Pickle serializer, so Django's own cache users (cache_page, the per-site
+    # cache, template fragments) can store arbitrary Python objects
     "default": {
-        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "BACKEND": "django_redis.cache.RedisCache",
         "LOCATION": os.environ.get("REDIS_URL", "redis://redis:6379/1"),
         "KEY_PREFIX": "myapp",  # Prefix all cache keys
-        "OPTIONS": {
-            "client_class": "django_redis.client.DefaultClient",
-            "socket_connect_timeout": 5,  # seconds
-            "socket_timeout": 5,  # seconds
-            "ignore_exceptions": True,  # Don't crash on Redis errors
-        },
-    }
+        "OPTIONS": _REDIS_OPTIONS,
+    },
 }
 
 # Session cache configuration
-SESSION_ENGINE = "django.contrib.sessions.backends.cached_db"
+# Web/admin sessions are read through the cache but persisted in the database,
+# so a Redis outage or eviction doesn't log users out. The API authenticates
+# with JWT and skips the session middleware, so it does no session I/O at all.
+SESSION_ENGINE = os.environ.get("SESSION_ENGINE", "django.contrib.sessions.backends.cached_db")
 SESSION_CACHE_ALIAS = "default"
+SESSION_SAVE_EVERY_REQUEST = False
 
 # Consider where to use caching
 CACHE_MIDDLEWARE_ALIAS = "default"
@@ -35,8 +53,14 @@ CACHE_MIDDLEWARE_KEY_PREFIX = "myapp"
 
 
 # Smart cache key function for template fragments
+_PREFIX = "tpl.cache."
+
+
 def make_template_fragment_key(fragment_name, vary_on=None):
-    if vary_on is None:
-        vary_on = ()
-    key = ":".join(str(var) for var in vary_on)
-    return f"template.cache.{fragment_name}.{key}"
+    # Hash the vary_on values so keys stay short and bounded in length. Hashing
+    # the repr of the whole tuple keeps value boundaries, so ("ab", "c") and
+    # ("a", "bc") get different keys.
+    if not vary_on:
+        return _PREFIX + fragment_name
+    digest = xxhash.xxh3_64(repr(tuple(vary_on)).encode())
+    return f"{_PREFIX}{fragment_name}.{digest.hexdigest()}"
@@ -16,12 +16,35 @@ ENVIRONMENT = ENVIRONMENT.lower()
 # Hardcoded Celery broker URLs based on environment
 if ENVIRONMENT == "production":
     CELERY_BROKER_URL = "redis://redis:6379/0"
+    _DEFAULT_RESULT_BACKEND = "redis://redis:6379/2"
 elif ENVIRONMENT == "staging":
     CELERY_BROKER_URL = "redis://redis:6379/0"
+    _DEFAULT_RESULT_BACKEND = "redis://redis:6379/2"
 else:  # development
     CELERY_BROKER_URL = "redis://localhost:6379/0"
+    _DEFAULT_RESULT_BACKEND = "redis://localhost:6379/2"
 
-CELERY_RESULT_BACKEND = "django-db"
+# Broker connections
+# Size the pool to the worker concurrency instead of Kombu's default of 10
+CELERY_BROKER_POOL_LIMIT = int(os.environ.get("CELERY_BROKER_POOL_LIMIT", "20"))
+CELERY_BROKER_CONNECTION_RETRY_ON_STARTUP = True
+# AMQP-style heartbeats are useless with Redis and only add idle traffic
+CELERY_BROKER_HEARTBEAT = 0
+CELERY_BROKER_TRANSPORT_OPTIONS = {
+    # Must exceed the longest task run time (CELERY_TASK_TIME_LIMIT) with acks_late
+    "visibility_timeout": 60 * 60,  # 1 hour
+    "socket_keepalive": True,
+}
+CELERY_EVENT_QUEUE_EXPIRES = 60
+
+# Store results in Redis (separate DB index from the broker) rather than
+# the database, so task results never cost a Postgres write
+CELERY_RESULT_BACKEND = os.environ.get("CELERY_RESULT_BACKEND", _DEFAULT_RESULT_BACKEND)
+CELERY_RESULT_EXPIRES = 60 * 60  # 1 hour
+CELERY_RESULT_BACKEND_TRANSPORT_OPTIONS = {"global_keyprefix": "celery-results:"}
+
+# Don't store results unless a task opts in with @shared_task(ignore_result=False)
+CELERY_TASK_IGNORE_RESULT = True
 
 # Serialization
 CELERY_ACCEPT_CONTENT = ["json"]
@@ -29,10 +52,12 @@ CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
 
 # Task specific settings
-CELERY_TASK_TRACK_STARTED = True
 CELERY_TASK_TIME_LIMIT = 30 * 60  # 30 minutes
 CELERY_TASK_SOFT_TIME_LIMIT = 25 * 60  # 25 minutes
 CELERY_WORKER_MAX_TASKS_PER_CHILD = 1000  # Prevent memory leaks
+# Acknowledge after the task runs so tasks from a crashed worker are redelivered
+CELERY_TASK_ACKS_LATE = True
+CELERY_TASK_REJECT_ON_WORKER_LOST = True
 
 # Task queues - define named queues for different task types
 CELERY_TASK_ROUTES = {
@@ -56,8 +81,25 @@ CELERY_BEAT_SCHEDULE = {
 # Timezone for Celery Beat
 CELERY_TIMEZONE = "UTC"
 
-# Rate limiting
-CELERY_WORKER_PREFETCH_MULTIPLIER = 1  # Prefetch one task at a time
+# Prefetching
+# A higher multiplier amortizes broker round-trips over many short tasks.
+# Prefetching is per worker, not per queue, so workers consuming the
+# long-running "heavy_tasks" queue should be started with
+# `--prefetch-multiplier=1 -O fair` to avoid holding tasks they can't run yet.
+CELERY_WORKER_PREFETCH_MULTIPLIER = int(os.environ.get("CELERY_PREFETCH_MULTIPLIER", "2"))
+
+# Rate limiting - no task uses rate limits, so skip the per-task bookkeeping
+CELERY_WORKER_DISABLE_RATE_LIMITS = True
+
+# Allow pool restarts via the broadcast "pool_restart" command
+CELERY_WORKER_POOL_RESTARTS = True
 
 # Monitoring settings
-CELERY_SEND_TASK_SENT_EVENT = True
+# Events cost an extra broker publish per task; only enable them while a
+# monitor such as Flower is consuming them.
+CELERY_SEND_TASK_SENT_EVENT = (
+    os.environ.get("CELERY_SEND_TASK_SENT_EVENT", "false").lower() == "true"
+)
+CELERY_WORKER_SEND_TASK_EVENTS = (
+    os.environ.get("CELERY_WORKER_SEND_TASK_EVENTS", "false").lower() == "true"
+)
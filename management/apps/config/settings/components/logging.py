@@ -36,6 +36,12 @@ LOGGING = {
             "format": "{levelname} {message}",
             "style": "{",
         },
+        # Structured logs for the log files: serialized by orjson, and parsed
+        # by log shippers without regexes
+        "json": {
+            "()": "pythonjsonlogger.orjson.OrjsonFormatter",
+            "format": "%(levelname)s %(asctime)s %(module)s %(process)d %(thread)d %(message)s",
+        },
     },
     "handlers": {
         "console": {
@@ -44,11 +50,19 @@ LOGGING = {
             "class": "logging.StreamHandler",
             "formatter": "simple",
         },
+        # Writes to the log files happen on a background thread: loggers send
+        # records to "queue", and the listener started in
+        # ConfigConfig.ready() forwards them to "file" and "error_file".
+        "queue": {
+            "class": "logging.handlers.QueueHandler",
+            "queue": "ext://apps.config.log_queue.queue",
+        },
         "file": {
             "level": "INFO",
-            "class": "logging.FileHandler",
+            # Reopens the file if it is rotated externally (e.g. by logrotate)
+            "class": "logging.handlers.WatchedFileHandler",
             "filename": str(LOGS_DIR / "django.log"),
-            "formatter": "verbose",
+            "formatter": "json",
         },
         "error_file": {
             "level": "ERROR",
@@ -56,7 +70,7 @@ LOGGING = {
             "filename": str(LOGS_DIR / "error.log"),
             "maxBytes": 1024 * 1024 * 5,  # 5 MB
             "backupCount": 5,
-            "formatter": "verbose",
+            "formatter": "json",
         },
         "mail_admins": {
             "level": "ERROR",
@@ -67,12 +81,12 @@ LOGGING = {
     },
     "loggers": {
         "django": {
-            "handlers": ["console", "file"],
+            "handlers": ["console", "queue"],
             "level": "INFO",
             "propagate": True,
         },
         "django.server": {
-            "handlers": ["console", "file"],
+            "handlers": ["console", "queue"],
             "level": "INFO",
             "propagate": False,
         },
@@ -91,25 +105,37 @@ LOGGING = {
             "level": "INFO",
             "propagate": False,
         },
+        # N+1 query detection (enabled in development settings)
+        "nplusone": {
+            "handlers": ["console", "queue"],
+            "level": "WARNING",
+            "propagate": False,
+        },
         # Application logging
         "core": {
-            "handlers": ["console", "file", "error_file"],
+            "handlers": ["console", "queue"],
             "level": "INFO",
             "propagate": False,
         },
         "users": {
-            "handlers": ["console", "file", "error_file"],
+            "handlers": ["console", "queue"],
             "level": "INFO",
             "propagate": False,
         },
+        # Sink for the background queue listener
+        "apps.config.log_queue": {
+            "handlers": ["file", "error_file"],
+            "level": "DEBUG",
+            "propagate": False,
+        },
         "apps.config.middleware": {
-            "handlers": ["console", "file"],
+            "handlers": ["console", "queue"],
             "level": "INFO",
-            "propagate": True,
+            "propagate": False,
         },
     },
     "root": {
-        "handlers": ["console", "file"],
+        "handlers": ["console", "queue"],
         "level": "INFO",
     },
 }
@@ -5,6 +5,7 @@ Includes debugging tools and uses PostgreSQL database.
 """
 
 import os
+import logging
 from .base import *  # noqa
 
 # Debug mode enabled for development
@@ -19,10 +20,19 @@ INTERNAL_IPS = ["127.0.0.1", "localhost"]
 
 # Use Django Browser Reload if not already included
 if "django_browser_reload" not in INSTALLED_APPS:  # noqa
-    INSTALLED_APPS += ["django_browser_reload"]  # noqa
+    INSTALLED_APPS += ("django_browser_reload",)  # noqa
     # Check if the middleware is already there
-    if "django_browser_reload.middleware.BrowserReloadMiddleware" not in MIDDLEWARE:  # noqa
-        MIDDLEWARE += ["django_browser_reload.middleware.BrowserReloadMiddleware"]  # noqa
+    _browser_reload_middleware = "django_browser_reload.middleware.BrowserReloadMiddleware"
+    if _browser_reload_middleware not in WEB_ONLY_MIDDLEWARE:  # noqa
+        WEB_ONLY_MIDDLEWARE += (_browser_reload_middleware,)  # noqa
+
+# Detect N+1 queries (lazy loads that should use select_related/prefetch_related)
+if DEBUG:
+    INSTALLED_APPS += ("nplusone.ext.django",)  # noqa
+    MIDDLEWARE = ("nplusone.ext.django.NPlusOneMiddleware",) + MIDDLEWARE  # noqa
+    NPLUSONE_LOGGER = logging.getLogger("nplusone")
+    NPLUSONE_LOG_LEVEL = logging.WARNING
+    NPLUSONE_RAISE = True  # Make tests fail on N+1 regressions
 
 # Use console email backend for development
 EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
@@ -39,7 +49,7 @@ CACHES = {
 }
 
 # Disable CSRF for development if needed
-MIDDLEWARE = [m for m in MIDDLEWARE if "CsrfViewMiddleware" not in m]  # noqa
+WEB_ONLY_MIDDLEWARE = tuple(m for m in WEB_ONLY_MIDDLEWARE if "CsrfViewMiddleware" not in m)  # noqa
 
 # Use normal logging in development (not the minimal version)
 # This will use the configuration from components/logging.py
@@ -6,25 +6,35 @@ performance optimizations.
 """
 
 import os
+
+import environ
+
 from .base import *  # noqa
 
+# Typed environment access, shared by staging through its star import
+env = environ.Env(EMAIL_PORT=(int, 587))
+
 # Force DEBUG to be False in production
 DEBUG = False
 
-# Allowed hosts must come from environment variables in production
-ALLOWED_HOSTS = os.environ.get("DJANGO_ALLOWED_HOSTS", "").split(",")
-if not ALLOWED_HOSTS:
-    raise Exception("DJANGO_ALLOWED_HOSTS environment variable not set!")
+# Allowed hosts must come from environment variables in production. An empty
+# list is reported by the config.E004 system check, so settings modules that
+# import this one can still set their own ALLOWED_HOSTS.
+ALLOWED_HOSTS = env.list("DJANGO_ALLOWED_HOSTS", default=[])
 
 # Security settings - already defined in components/security.py
 # but explicitly ensure they're enabled in production
 CSRF_COOKIE_SECURE = True
 SESSION_COOKIE_SECURE = True
 SECURE_SSL_REDIRECT = True
-SECURE_HSTS_SECONDS = 60 * 60 * 24 * 7 * 52  # 1 year
+SECURE_HSTS_SECONDS = 31_449_600  # 1 year (60 * 60 * 24 * 7 * 52)
 SECURE_HSTS_INCLUDE_SUBDOMAINS = True
 SECURE_HSTS_PRELOAD = True
 
+# TLS is terminated at the reverse proxy, which sets X-Forwarded-Proto and strips
+# any client-supplied value; trust it so HTTPS requests aren't redirected again
+SECURE_PROXY_SSL_HEADER = ("HTTP_X_FORWARDED_PROTO", "https")
+
 # Static and media file storage
 # Uncomment if using S3 for production storage
 # AWS_ACCESS_KEY_ID = os.environ.get("AWS_ACCESS_KEY_ID")
@@ -40,20 +50,21 @@ SECURE_HSTS_PRELOAD = True
 
 # Email configuration
 EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
-EMAIL_HOST = os.environ.get("EMAIL_HOST")
-EMAIL_PORT = int(os.environ.get("EMAIL_PORT", "587"))
-EMAIL_HOST_USER = os.environ.get("EMAIL_HOST_USER")
-EMAIL_HOST_PASSWORD = os.environ.get("EMAIL_HOST_PASSWORD")
+EMAIL_HOST = env("EMAIL_HOST", default=None)
+EMAIL_PORT = env("EMAIL_PORT")
+EMAIL_HOST_USER = env("EMAIL_HOST_USER", default=None)
+EMAIL_HOST_PASSWORD = env("EMAIL_HOST_PASSWORD", default=None)
 EMAIL_USE_TLS = True
-DEFAULT_FROM_EMAIL = os.environ.get("DEFAULT_FROM_EMAIL")
+DEFAULT_FROM_EMAIL = env("DEFAULT_FROM_EMAIL", default=None)
 
 # Logging - adjust levels for production
 LOGGING["handlers"]["file"]["level"] = "ERROR"  # noqa
 LOGGING["loggers"]["django"]["level"] = "ERROR"  # noqa
 
 # Ensure sensitive values are set
-REQUIRED_ENV_VARS = ["DJANGO_SECRET_KEY", "POSTGRES_PASSWORD", "POSTGRES_USER", "POSTGRES_DB"]
+REQUIRED_ENV_VARS = ("DJANGO_SECRET_KEY", "POSTGRES_PASSWORD", "POSTGRES_USER", "POSTGRES_DB")
 
-for var in REQUIRED_ENV_VARS:
-    if not os.environ.get(var):
-        raise Exception(f"Required environment variable {var} is not set!")
+_environ = os.environ
+_missing_env_vars = [var for var in REQUIRED_ENV_VARS if not _environ.get(var)]
+if _missing_env_vars:
+    raise Exception(f"Required environment variables are not set: {', '.join(_missing_env_vars)}")
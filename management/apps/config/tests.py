@@ -0,0 +1,51 @@
+import tempfile
+from pathlib import Path
+from unittest import TestCase, mock
+
+from apps.config.utils import app_discovery
+
+
+class LoadDiscoveredAppsTests(TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        self.apps_dir = self.root / "apps"
+        self._make_app(self.apps_dir / "blog")
+        self._clear_process_caches()
+        self.addCleanup(self._clear_process_caches)
+
+    def _make_app(self, directory):
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / "apps.py").touch()
+
+    def _clear_process_caches(self):
+        # Simulate a fresh process: only the on-disk cache survives
+        app_discovery._discover_apps_cached.cache_clear()
+        app_discovery._scan_project.cache_clear()
+        app_discovery.is_django_app.cache_clear()
+
+    def _load(self):
+        self._clear_process_caches()
+        return app_discovery.load_discovered_apps(self.apps_dir, self.root)
+
+    def test_second_load_is_a_cache_hit(self):
+        self.assertEqual(self._load(), (["apps.blog"], []))
+
+        with mock.patch.object(app_discovery, "_scan_project") as scan:
+            self.assertEqual(self._load(), (["apps.blog"], []))
+            self.assertEqual(self._load(), (["apps.blog"], []))
+        scan.assert_not_called()
+
+    def test_nested_app_invalidates_the_cache(self):
+        (self.apps_dir / "blog" / "comments").mkdir()
+        self.assertEqual(self._load(), (["apps.blog"], []))
+
+        self._make_app(self.apps_dir / "blog" / "comments")
+        self.assertEqual(self._load(), (["apps.blog", "apps.blog.comments"], []))
+
+    def test_custom_app_invalidates_the_cache(self):
+        self._load()
+
+        self._make_app(self.root / "custom" / "shop")
+        self.assertEqual(self._load(), (["apps.blog"], ["custom.shop"]))
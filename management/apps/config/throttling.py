@@ -0,0 +1,71 @@
+"""
+Custom throttle classes for the API.
+"""
+
+from rest_framework.throttling import AnonRateThrottle, SimpleRateThrottle, UserRateThrottle
+
+# Count the request and start the window on the first hit, atomically.
+# Returns the request count in the current window and the seconds left in it.
+INCR_WITH_EXPIRY_SCRIPT = """
+local count = redis.call('INCR', KEYS[1])
+if count == 1 then
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+end
+return {count, redis.call('TTL', KEYS[1])}
+"""
+
+
+class LuaRateThrottle(SimpleRateThrottle):
+    """
+    Fixed-window throttle that counts requests with a single Redis Lua call.
+
+    DRF's throttles do a cache get followed by a set, which costs two round
+    trips and can miscount under concurrent requests. Here the increment and
+    expiry happen atomically on the Redis server. Falls back to DRF's
+    behaviour when the cache is not backed by django-redis (e.g. LocMemCache
+    in development).
+    """
+
+    def allow_request(self, request, view):
+        client = self._get_redis_client()
+        if client is None:
+            return super().allow_request(request, view)
+
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        from redis.exceptions import RedisError
+
+        try:
+            count, self.remaining = client.eval(
+                INCR_WITH_EXPIRY_SCRIPT, 1, self.cache.make_key(self.key), self.duration
+            )
+        except RedisError:
+            # Fail open, like the cache backend's IGNORE_EXCEPTIONS
+            return True
+
+        return count <= self.num_requests
+
+    def wait(self):
+        if not hasattr(self, "remaining"):
+            return super().wait()
+        return max(self.remaining, 0)
+
+    def _get_redis_client(self):
+        """Return the raw Redis client behind the cache, if there is one."""
+        client = getattr(self.cache, "client", None)
+        if client is None or not hasattr(client, "get_client"):
+            return None
+        return client.get_client(write=True)
+
+
+class LuaAnonRateThrottle(LuaRateThrottle, AnonRateThrottle):
+    """Limits the rate of API calls that may be made by anonymous users."""
+
+
+class LuaUserRateThrottle(LuaRateThrottle, UserRateThrottle):
+    """Limits the rate of API calls that may be made by a given user."""
@@ -2,54 +2,51 @@
 API URL configuration for the project.
 """
 
+from django.conf import settings
 from django.urls import path, include
+from django.views.decorators.cache import cache_page
+from django.views.decorators.vary import vary_on_headers
+from drf_spectacular.views import SpectacularAPIView, SpectacularRedocView, SpectacularSwaggerView
+
+from apps.authentication.views import TokenRefreshView, TokenVerifyView
+
+# The schema and docs only change on deploy
+SCHEMA_CACHE_SECONDS = 60 * 60 * 24
+
+# cache_page stores whole HttpResponse objects, so it needs a cache that uses
+# the pickle serializer
+SCHEMA_CACHE_ALIAS = "default"
+
+
+def _cached(view):
+    """Cache a schema/docs view per release, keeping JSON and HTML responses apart"""
+    return cache_page(
+        SCHEMA_CACHE_SECONDS,
+        cache=SCHEMA_CACHE_ALIAS,
+        key_prefix=f"schema.{settings.RELEASE_VERSION}",
+    )(vary_on_headers("Accept")(view))
+
 
-# Define the API URL patterns
 api_urlpatterns = [
     # API versioning
     # path('v1/', include('apps.config.urls.api_v1')),
     # API authentication
     path("auth/", include("rest_framework.urls")),
+    # JWT authentication endpoints
+    path("token/refresh/", TokenRefreshView.as_view(), name="token_refresh"),
+    path("token/verify/", TokenVerifyView.as_view(), name="token_verify"),
+    # API schema and documentation
+    path("schema/", _cached(SpectacularAPIView.as_view()), name="schema"),
+    path(
+        "docs/",
+        _cached(SpectacularSwaggerView.as_view(url_name="schema")),
+        name="swagger-ui",
+    ),
+    path(
+        "redoc/",
+        _cached(SpectacularRedocView.as_view(url_name="schema")),
+        name="redoc",
+    ),
 ]
 
-# Add JWT authentication endpoints
-try:
-    from apps.authentication.views import (
-        TokenVerifyView,
-        TokenRefreshView,
-    )
-
-    api_urlpatterns += [
-        path("token/refresh/", TokenRefreshView.as_view(), name="token_refresh"),
-        path("token/verify/", TokenVerifyView.as_view(), name="token_verify"),
-    ]
-except ImportError:
-    pass
-
-# Add drf-spectacular documentation endpoints
-try:
-    from drf_spectacular.views import (
-        SpectacularAPIView,
-        SpectacularRedocView,
-        SpectacularSwaggerView,
-    )
-
-    api_urlpatterns += [
-        # API schema and documentation
-        path("schema/", SpectacularAPIView.as_view(), name="schema"),
-        path(
-            "docs/",
-            SpectacularSwaggerView.as_view(url_name="schema"),
-            name="swagger-ui",
-        ),
-        path(
-            "redoc/",
-            SpectacularRedocView.as_view(url_name="schema"),
-            name="redoc",
-        ),
-    ]
-except ImportError:
-    pass
-
-# Create an __init__.py file to make the directory a package
 urlpatterns = api_urlpatterns
@@ -10,12 +10,6 @@ from django.http import JsonResponse
 
 from .api import api_urlpatterns
 
-
-# Admin site customization
-admin.site.site_header = "Management Portal"
-admin.site.site_title = "Management Admin"
-admin.site.index_title = "Administration"
-
 urlpatterns = [
     path('authentication/', include('apps.authentication.urls', namespace='authentication')),
     # Admin interface
@@ -2,87 +2,257 @@
 Utility functions for discovering Django apps in the project.
 """
 
+import ast
+import functools
+import hashlib
+import json
+import mmap
 import os
+import sys
 from pathlib import Path
 
+__all__ = (
+    "discover_all_apps",
+    "discover_apps",
+    "is_django_app",
+    "load_discovered_apps",
+    "register_app",
+)
 
+# Where discovery results are cached across processes, relative to the project
+# root. The directory is hidden so the scan skips it: writing the cache must not
+# change the mtime of any directory the cache's fingerprint covers.
+CACHE_DIRNAME = ".cache"
+CACHE_FILENAME = "app_discovery.json"
+
+# Directories under apps/ that are not apps themselves or never contain apps
+SKIPPED_DIRS = frozenset({"config", "__pycache__", "migrations"})
+
+# Top-level directories that never contain Django apps
+NON_APP_DIRS = frozenset({"venv", ".venv", "env", "media", "static", "__pycache__"})
+
+# Directories never descended into while scanning for apps
+_WALK_SKIPPED_DIRS = SKIPPED_DIRS | NON_APP_DIRS
+
+# File whose presence marks a directory as a Django app
+_APP_PY = sys.intern("apps.py")
+
+
+@functools.lru_cache(maxsize=None)
 def is_django_app(directory):
     """Check if a directory is a Django app by looking for apps.py"""
-    return (Path(directory) / "apps.py").exists()
+    return os.path.isfile(os.fspath(directory) + os.sep + _APP_PY)
 
 
 def discover_apps(base_dir, include_subdirs=True):
     """
     Discover Django apps in the given directory and its subdirectories.
     Returns a list of dotted module paths for discovered apps.
+
+    Results are cached per process, so repeated settings imports don't
+    re-scan the filesystem.
     """
+    return list(_discover_apps_cached(str(base_dir), include_subdirs))
+
+
+@functools.lru_cache(maxsize=None)
+def _discover_apps_cached(base_dir, include_subdirs):
+    """Scan ``base_dir`` for apps; memoized by ``discover_apps``."""
     apps = []
-    base_dir = Path(base_dir)
+    seen = set()
 
     # Get the project root directory
-    project_root = base_dir.parent if base_dir.name == "apps" else base_dir.parent.parent
+    parent = os.path.dirname(base_dir)
+    project_root = parent if os.path.basename(base_dir) == "apps" else os.path.dirname(parent)
 
-    # Function to get module path relative to project root
-    def get_module_path(app_dir):
-        rel_path = app_dir.relative_to(project_root)
-        return str(rel_path).replace(os.sep, ".")
+    # Single scandir pass: list each directory once, classify children from the
+    # DirEntry without an extra stat, and only descend when asked to
+    def walk(directory):
+        with os.scandir(directory) as entries:
+            subdirs = [
+                entry.path
+                for entry in entries
+                if entry.name not in _WALK_SKIPPED_DIRS and entry.is_dir(follow_symlinks=False)
+            ]
+        for path in subdirs:
+            if os.path.isfile(path + os.sep + _APP_PY):
+                module_path = sys.intern(os.path.relpath(path, project_root).replace(os.sep, "."))
+                if module_path not in seen:
+                    seen.add(module_path)
+                    apps.append(module_path)
+        if include_subdirs:
+            for path in subdirs:
+                walk(path)
 
-    # First check directly in the base directory
-    for item in base_dir.iterdir():
-        if item.is_dir() and is_django_app(item):
-            apps.append(get_module_path(item))
+    walk(base_dir)
+    return tuple(apps)
 
-    # Now look in subdirectories if requested
-    if include_subdirs:
-        # Use os.walk to find all subdirectories
-        for root, dirs, _ in os.walk(str(base_dir)):
-            root_path = Path(root)
-            # Skip the root directory as we already checked it
-            if root_path == base_dir:
-                continue
 
-            for dir_name in dirs:
-                dir_path = root_path / dir_name
-                if is_django_app(dir_path):
-                    module_path = get_module_path(dir_path)
-                    if module_path not in apps:
-                        apps.append(module_path)
+def discover_all_apps(root_dir):
+    """
+    Discover all Django apps in the project, including custom directories.
+    """
+    return list(_scan_project(str(root_dir))[0])
 
-    return apps
 
+@functools.lru_cache(maxsize=None)
+def _scan_project(root_dir):
+    """
+    Scan the whole project for apps; memoized by ``discover_all_apps``.
 
-def discover_all_apps(root_dir):
+    Returns ``(apps, dir_mtimes)``, where ``dir_mtimes`` holds a
+    ``(path, st_mtime_ns)`` pair for every directory visited. Each directory is
+    stat'ed before it is listed, so a change made during the scan still shows up
+    as a changed mtime later.
     """
-    Discover all Django apps in the project, including custom directories.
+    found = set()
+    dir_mtimes = []
+
+    # One traversal of the whole project. Pruning happens before descending, so
+    # a virtualenv inside the project is never walked (rglob can't prune).
+    def walk(directory):
+        dir_mtimes.append((directory, os.stat(directory).st_mtime_ns))
+        subdirs = []
+        has_app = False
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in _WALK_SKIPPED_DIRS and not entry.name.startswith("."):
+                        subdirs.append(entry.path)
+                elif entry.name == _APP_PY:
+                    has_app = True
+        if has_app and directory != root_dir:
+            found.add(sys.intern(os.path.relpath(directory, root_dir).replace(os.sep, ".")))
+        for path in subdirs:
+            walk(path)
+
+    walk(root_dir)
+    return tuple(sorted(found)), tuple(sorted(dir_mtimes))
+
+
+def _fingerprint(dir_mtimes):
+    """blake2b hex digest of ``(path, st_mtime_ns)`` pairs"""
+    data = b"\0".join(f"{path}:{mtime}".encode() for path, mtime in dir_mtimes)
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _current_fingerprint(dirs):
+    """
+    Fingerprint of the directories a previous scan visited, or None if one is gone.
+
+    Adding or removing an app (or any subdirectory) changes the mtime of the
+    directory containing it, so re-stat'ing the visited directories catches
+    changes at any depth without listing them again.
+    """
+    try:
+        return _fingerprint((path, os.stat(path).st_mtime_ns) for path in dirs)
+    except OSError:
+        return None
+
+
+def load_discovered_apps(apps_dir, root_dir):
+    """
+    Return ``(local_apps, custom_apps)`` for the project.
+
+    Local apps live in ``apps_dir``; custom apps are those found elsewhere in
+    the project. The result is cached on disk and reused until a directory the
+    scan visited changes, so warm starts only stat directories.
     """
+    apps_dir = Path(apps_dir)
     root_dir = Path(root_dir)
-    apps_dir = root_dir / "apps"
-    all_apps = []
+    cache_dir = root_dir / CACHE_DIRNAME
+    cache_file = cache_dir / CACHE_FILENAME
+
+    # Create the cache directory before anything is scanned; creating it later
+    # would change root_dir's mtime and invalidate the fingerprint just written
+    try:
+        cache_dir.mkdir(exist_ok=True)
+    except OSError:
+        pass
+
+    try:
+        with open(cache_file, encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached["fingerprint"] == _current_fingerprint(cached["dirs"]):
+            return list(cached["local_apps"]), list(cached["custom_apps"])
+    except (OSError, KeyError, TypeError, ValueError):
+        pass
+
+    local_apps = discover_apps(apps_dir, include_subdirs=True)
+    local = set(local_apps)
+    all_apps, dir_mtimes = _scan_project(str(root_dir))
+    custom_apps = [app for app in all_apps if app not in local]
+
+    # Write atomically so concurrently starting processes never read a partial file
+    tmp_file = cache_file.with_name(f"{CACHE_FILENAME}.{os.getpid()}")
+    try:
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "fingerprint": _fingerprint(dir_mtimes),
+                    "dirs": [path for path, _ in dir_mtimes],
+                    "local_apps": local_apps,
+                    "custom_apps": custom_apps,
+                },
+                f,
+            )
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
+
+    return local_apps, custom_apps
+
 
-    # Discover apps in the standard apps directory (including nested apps)
-    all_apps.extend(discover_apps(apps_dir, include_subdirs=True))
+# Marker in settings/base.py showing that INSTALLED_APPS is built by auto-discovery
+AUTO_DISCOVERY_MARKER = b"load_discovered_apps(APPS_DIR"
 
-    # Discover apps in other directories at the project root level
-    for item in root_dir.iterdir():
-        if item.is_dir() and item.name != "apps" and not item.name.startswith("."):
-            # Skip common non-app directories
-            if item.name in {"venv", ".venv", "env", "media", "static", "__pycache__"}:
-                continue
+# Parsed settings files keyed by path, reused while the file's mtime is unchanged
+_ast_cache = {}
 
-            # Check for Django apps in this directory and its subdirectories
-            if is_django_app(item):
-                module_path = item.name
-                all_apps.append(module_path)
+# Settings lists an app can be registered in, in order of preference
+APP_LIST_NAMES = ("LOCAL_APPS", "INSTALLED_APPS")
 
-            # Also check subdirectories
-            all_apps.extend(discover_apps(item, include_subdirs=True))
 
-    return all_apps
+def _uses_auto_discovery(settings_file):
+    """Check for the auto-discovery marker without reading the file into a str"""
+    with open(settings_file, "rb") as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return mapped.find(AUTO_DISCOVERY_MARKER) != -1
+        except ValueError:  # Empty file
+            return False
+
+
+def _parse_settings(settings_file):
+    """Return ``(content, tree)`` for the settings file, cached by its mtime"""
+    mtime = settings_file.stat().st_mtime_ns
+    cached = _ast_cache.get(settings_file)
+    if cached is not None and cached[0] == mtime:
+        return cached[1], cached[2]
+    content = settings_file.read_text()
+    tree = ast.parse(content, filename=os.fspath(settings_file))
+    _ast_cache[settings_file] = (mtime, content, tree)
+    return content, tree
+
+
+def _app_lists(tree):
+    """Map each name in ``APP_LIST_NAMES`` to the list literal assigned to it"""
+    app_lists = {}
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Assign) or not isinstance(node.value, ast.List):
+            continue
+        for target in node.targets:
+            if isinstance(target, ast.Name) and target.id in APP_LIST_NAMES:
+                app_lists.setdefault(target.id, node.value)
+    return app_lists
 
 
 def register_app(app_name):
     """
     Register a new app in settings/base.py by updating INSTALLED_APPS.
+
+    Nothing is written when base.py already builds INSTALLED_APPS from
+    auto-discovery, since the new app will be picked up on the next start.
     """
     from django.conf import settings
 
@@ -92,24 +262,31 @@ def register_app(app_name):
     if not settings_file.exists():
         return False
 
-    content = settings_file.read_text()
+    if _uses_auto_discovery(settings_file):
+        return True
+
+    content, tree = _parse_settings(settings_file)
+    app_lists = _app_lists(tree)
 
     # Check if the app is already registered
-    if f"'{app_name}'" in content or f'"{app_name}"' in content:
-        return True
+    for app_list in app_lists.values():
+        if any(isinstance(elt, ast.Constant) and elt.value == app_name for elt in app_list.elts):
+            return True
 
-    # Find a good place to add the app
-    # First try LOCAL_APPS
-    if "LOCAL_APPS = [" in content:
-        new_content = content.replace("LOCAL_APPS = [", f"LOCAL_APPS = [\n    '{app_name}',")
-    # If not, try INSTALLED_APPS directly
-    elif "INSTALLED_APPS = [" in content:
-        new_content = content.replace(
-            "INSTALLED_APPS = [", f"INSTALLED_APPS = [\n    '{app_name}',"
-        )
-    else:
+    # Prefer LOCAL_APPS, then INSTALLED_APPS
+    target = next((app_lists[name] for name in APP_LIST_NAMES if name in app_lists), None)
+    if target is None:
         return False
 
+    # Insert right after the opening bracket, leaving the rest of the file
+    # (comments and formatting included) untouched. AST column offsets are in
+    # UTF-8 bytes.
+    lines = content.splitlines(keepends=True)
+    line = lines[target.lineno - 1].encode()
+    split = target.col_offset + 1
+    entry = f"\n    '{app_name}',".encode()
+    lines[target.lineno - 1] = (line[:split] + entry + line[split:]).decode()
+
     # Write the updated content
-    settings_file.write_text(new_content)
+    settings_file.write_text("".join(lines))
     return True
@@ -1,7 +1,7 @@
-from django.core.mail import EmailMessage
-from django.template.loader import render_to_string
+from django.core.mail import EmailMessage, EmailMultiAlternatives
+from django.core.signals import setting_changed
 from django.conf import settings
-from django.utils.html import strip_tags
+from django.dispatch import receiver
 import logging
 
 logger = logging.getLogger(__name__)
@@ -12,13 +12,64 @@ class EmailService:
     Centralized email service for sending various types of emails
     """
 
-    @staticmethod
-    def _get_template_config(email_type):
+    # Compiled base templates, loaded on first use and kept unless DEBUG is on,
+    # so template edits show up during development. The plain-text template is
+    # optional; False records that it doesn't exist.
+    _base_template = None
+    _text_template = None
+
+    # Settings read on first use: template configs per email type, and the
+    # (subject prefix, from address) pair. Cleared on setting_changed.
+    _tpl_cfg_cache = {}
+    _mail_defaults = None
+
+    @classmethod
+    def _tpl(cls):
+        """Get the compiled base email template"""
+        template = cls._base_template
+        if template is None:
+            from django.template.loader import get_template
+
+            template = get_template(f"{settings.EMAIL_TEMPLATE_DIR}/base_email.html")
+            if not settings.DEBUG:
+                cls._base_template = template
+        return template
+
+    @classmethod
+    def _text_tpl(cls):
+        """Get the compiled plain-text email template, or None if there isn't one"""
+        template = cls._text_template
+        if template is None:
+            from django.template import TemplateDoesNotExist
+            from django.template.loader import get_template
+
+            try:
+                template = get_template(f"{settings.EMAIL_TEMPLATE_DIR}/base_email.txt")
+            except TemplateDoesNotExist:
+                template = False
+            if not settings.DEBUG:
+                cls._text_template = template
+        return template or None
+
+    @classmethod
+    def _get_template_config(cls, email_type):
         """Get email template configuration"""
-        return settings.EMAIL_TEMPLATES.get(email_type, {})
+        cache = cls._tpl_cfg_cache
+        if email_type not in cache:
+            cache[email_type] = settings.EMAIL_TEMPLATES.get(email_type, {})
+        return cache[email_type]
+
+    @classmethod
+    def _defaults(cls):
+        """Get the subject prefix and sender address"""
+        if cls._mail_defaults is None:
+            cls._mail_defaults = (settings.EMAIL_SUBJECT_PREFIX, settings.DEFAULT_FROM_EMAIL)
+        return cls._mail_defaults
 
-    @staticmethod
-    def send_email(to_email, subject, body, action_url=None, action_text=None, footer_text=None):
+    @classmethod
+    def send_email(
+        cls, to_email, subject, body, action_url=None, action_text=None, footer_text=None
+    ):
         """
         Send a generic email using the base template
 
@@ -33,7 +84,6 @@ class EmailService:
         logger.info(f"Preparing to send email to: {to_email}")
         logger.info(f"Subject: {subject}")
 
-        template_name = f"{settings.EMAIL_TEMPLATE_DIR}/base_email.html"
         context = {
             "subject": subject,
             "body": body,
@@ -44,18 +94,25 @@ class EmailService:
 
         try:
             # Render HTML content
-            html_content = render_to_string(template_name, context)
-            text_content = strip_tags(html_content)
+            html_content = cls._tpl().render(context)
 
             # Create email message
-            email = EmailMessage(
-                subject=f"{settings.EMAIL_SUBJECT_PREFIX}{subject}",
-                body=text_content,
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                to=[to_email] if isinstance(to_email, str) else to_email,
-            )
-            email.content_subtype = "html"
-            email.body = html_content
+            subject_prefix, from_email = cls._defaults()
+            message_kwargs = {
+                "subject": f"{subject_prefix}{subject}",
+                "from_email": from_email,
+                "to": [to_email] if isinstance(to_email, str) else to_email,
+            }
+            text_template = cls._text_tpl()
+            if text_template:
+                # Send a plain-text part with the HTML as its alternative
+                email = EmailMultiAlternatives(body=text_template.render(context), **message_kwargs)
+                email.attach_alternative(html_content, "text/html")
+            else:
+                # No plain-text template, so send the HTML on its own rather
+                # than with an empty text part
+                email = EmailMessage(body=html_content, **message_kwargs)
+                email.content_subtype = "html"
 
             # Send email
             sent = email.send()
@@ -161,3 +218,15 @@ class EmailService:
             action_text="Login Now" if login_url else None,
             footer_text="Welcome aboard! We're excited to have you with us.",
         )
+
+
+@receiver(setting_changed)
+def _reset_email_caches(*, setting, **kwargs):
+    """Drop EmailService's cached templates and settings when one they depend on changes"""
+    if setting in ("DEBUG", "EMAIL_TEMPLATE_DIR", "TEMPLATES"):
+        EmailService._base_template = None
+        EmailService._text_template = None
+    elif setting == "EMAIL_TEMPLATES":
+        EmailService._tpl_cfg_cache.clear()
+    elif setting in ("EMAIL_SUBJECT_PREFIX", "DEFAULT_FROM_EMAIL"):
+        EmailService._mail_defaults = None
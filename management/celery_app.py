@@ -37,19 +37,6 @@ def handle_task_failure(sender=None, task_id=None, exception=None, **kwargs):
     )
 
 
-@worker_ready.connect
-def log_worker_ready(**kwargs):
-    """Log when a worker comes online."""
-    logger.info("Celery worker is ready")
-
-
-@app.task(bind=True)
-def debug_task(self):
-    """Debug task to verify Celery is working."""
-    logger.info(f"Request: {self.request!r}")
-    return {"status": "success", "message": "Debug task executed successfully"}
-
-
 # Configure task routing
 app.conf.task_routes = {
     "core.tasks.*": {"queue": "core"},
@@ -60,21 +47,9 @@ app.conf.task_routes = {
 app.conf.task_soft_time_limit = 60 * 5  # 5 minutes
 
 
-@app.task(bind=True, name="test_celery")
-def test_celery(self):
-    """Test task to verify Celery is working."""
-    print("Celery is working!")
-    logger.info("Celery test task executed successfully")
-    return {"status": "success", "message": "Celery is working correctly"}
-
-
-# To run this test task:
-from celery_app import test_celery
-
-test_celery.delay()
-
-
-@app.task(name="celery.status")
+# Opts in to result storage (CELERY_TASK_IGNORE_RESULT is on) so callers can
+# wait on the status reply
+@app.task(name="celery.status", ignore_result=False)
 def celery_status():
     """Return a message confirming that Celery is working."""
     message = "Celery is working correctly!"
@@ -86,8 +61,13 @@ def celery_status():
     }
 
 
+@app.on_after_configure.connect
+def log_configuration(sender, **kwargs):
+    """Log the broker once the configuration has been loaded."""
+    logger.info(f"Using broker: {sender.conf.broker_url}")
+
+
 @worker_ready.connect
 def at_worker_ready(sender, **kwargs):
     """Log when the worker is ready."""
     logger.info(f"Celery worker '{sender.hostname}' is ready.")
-    logger.info(f"Using broker: {app.conf.broker_url}")
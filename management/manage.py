@@ -4,6 +4,9 @@ import os
 import sys
 from pathlib import Path
 
+# Project root, resolved once rather than on every autoreload restart
+ROOT_DIR = Path(__file__).resolve().parent
+
 
 def main():
     """Run administrative tasks."""
@@ -11,9 +14,11 @@ def main():
     os.environ.setdefault("DJANGO_SETTINGS_MODULE", "apps.config.settings.development")
 
     # Add apps directory to Python path
-    root_dir = Path(__file__).resolve().parent
+    root_dir = ROOT_DIR
     apps_dir = root_dir / "apps"
-    sys.path.insert(0, str(root_dir))  # Add project root to path
+    root_path = os.fspath(root_dir)
+    if root_path not in sys.path:
+        sys.path.insert(0, root_path)  # Add project root to path
     
     try:
         from django.core.management import execute_from_command_line
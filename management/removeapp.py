@@ -7,7 +7,8 @@ from pathlib import Path
 
 # Add the current directory to Python path
 current_dir = Path(__file__).resolve().parent
-sys.path.insert(0, str(current_dir))
+if os.fspath(current_dir) not in sys.path:
+    sys.path.insert(0, os.fspath(current_dir))
 
 # Import the standalone function from the command
 from apps.config.management.commands.removeapp import remove_app_standalone